@@ -9,7 +9,7 @@ from .const import DOMAIN, ATTR_MANUFACTURER, DEFAULT_SCAN_INTERVAL
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["sensor"]
+PLATFORMS = ["sensor", "switch"]
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the SAJ Modbus component."""
@@ -30,13 +30,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_update_options))
+    hub.start_fast_updates()
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        await hass.data[DOMAIN][entry.entry_id]["hub"].close()
+        hub = hass.data[DOMAIN][entry.entry_id]["hub"]
+        hub.stop_fast_updates()
+        await hub.close()
         hass.data[DOMAIN].pop(entry.entry_id)
     return unload_ok
 
@@ -57,7 +60,7 @@ async def _create_hub(hass: HomeAssistant, entry: ConfigEntry) -> SAJModbusHub:
         await hub.async_config_entry_first_refresh()
         return hub
     except Exception as e:
-        _LOGGER.error(f"Failed to set up SAJ Modbus hub: {e}")
+        _LOGGER.error("Failed to set up SAJ Modbus hub: %s", e)
         return None
 
 def _create_device_info(entry: ConfigEntry) -> dict:
@@ -0,0 +1,113 @@
+"""Pending charge/discharge settings for the SAJ H2 inverter."""
+import logging
+from typing import Any, Dict
+
+from .const import (
+    REG_APP_MODE,
+    REG_CHARGE_DAY_MASK_POWER,
+    REG_CHARGE_END,
+    REG_CHARGE_START,
+    REG_CHARGING_STATE,
+    REG_DISCHARGE_DAY_MASK_POWER,
+    REG_DISCHARGE_END,
+    REG_DISCHARGE_START,
+    REG_DISCHARGING_STATE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Writable fields: name -> holding register address.
+PENDING_FIELDS: Dict[str, int] = {
+    "charge_start": REG_CHARGE_START,
+    "charge_end": REG_CHARGE_END,
+    "charge_day_mask_power": REG_CHARGE_DAY_MASK_POWER,
+    "discharge_start": REG_DISCHARGE_START,
+    "discharge_end": REG_DISCHARGE_END,
+    "discharge_day_mask_power": REG_DISCHARGE_DAY_MASK_POWER,
+    "app_mode": REG_APP_MODE,
+    "charging_enabled": REG_CHARGING_STATE,
+    "discharging_enabled": REG_DISCHARGING_STATE,
+}
+
+# Debounce window for flushing pending writes after the last setter call.
+PENDING_WRITE_DEBOUNCE = 0.3
+
+# After writing a state register the inverter takes a few poll cycles to
+# report the new value back; read-backs are suppressed for this long so the
+# switches do not flap.
+STATE_LOCK_WINDOW = 15.0
+
+
+class ChargeSettingHandler:
+    """Collects pending register writes and applies them in one batch."""
+
+    def __init__(self, hub) -> None:
+        self._hub = hub
+        self._pending: Dict[str, Any] = {}
+        self._charging_locked_until = 0.0
+        self._discharging_locked_until = 0.0
+
+    def set_pending(self, field: str, value: Any) -> None:
+        """Queue a new value for a writable field."""
+        if field not in PENDING_FIELDS:
+            raise ValueError(f"Unknown pending field: {field}")
+        self._pending[field] = value
+
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def any_lock_active(self, current_time: float) -> bool:
+        """Cheap steady-state gate: True only inside a post-write lock window."""
+        return current_time < self._charging_locked_until or current_time < self._discharging_locked_until
+
+    def is_charging_locked(self, current_time: float) -> bool:
+        return current_time < self._charging_locked_until
+
+    def is_discharging_locked(self, current_time: float) -> bool:
+        return current_time < self._discharging_locked_until
+
+    async def process_pending(self) -> None:
+        """Write all queued values to the inverter.
+
+        Contiguous registers are grouped into one write_registers request
+        (function 0x10), so a start/end/day-mask update of one slot - or
+        toggling both state registers - costs a single round-trip. Values
+        queued while a write is on the wire land in the (now empty) pending
+        dict and are drained by the caller's flush loop.
+        """
+        if not self._pending:
+            return
+        items = sorted(
+            (PENDING_FIELDS[field], field, int(value))
+            for field, value in self._pending.items()
+        )
+        self._pending.clear()
+        runs = [[items[0]]]
+        for item in items[1:]:
+            if item[0] == runs[-1][-1][0] + 1:
+                runs[-1].append(item)
+            else:
+                runs.append([item])
+        for run in runs:
+            address = run[0][0]
+            values = [value for _, _, value in run]
+            try:
+                if len(values) == 1:
+                    await self._hub._write_register(address, values[0])
+                else:
+                    await self._hub._write_registers(address, values)
+            except Exception as e:
+                _LOGGER.error(
+                    "Failed to write pending %s: %s",
+                    ", ".join(field for _, field, _ in run), e,
+                )
+                continue
+            now = self._hub._now()
+            for _, field, value in run:
+                if field == "charging_enabled":
+                    self._charging_locked_until = now + STATE_LOCK_WINDOW
+                elif field == "discharging_enabled":
+                    self._discharging_locked_until = now + STATE_LOCK_WINDOW
+                # Reflect the written value immediately so the UI does not
+                # wait for the next read-back (hub.data aliases inverter_data).
+                self._hub.inverter_data[field] = value
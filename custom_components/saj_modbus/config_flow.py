@@ -90,7 +90,7 @@ class SAJModbusOptionsFlowHandler(config_entries.OptionsFlow):
                 hub = self.hass.data[DOMAIN].get(self.config_entry.entry_id, {}).get("hub")
 
                 if hub is None:
-                    _LOGGER.error(f"Hub not found for entry_id: {self.config_entry.entry_id}")
+                    _LOGGER.error("Hub not found for entry_id: %s", self.config_entry.entry_id)
                     return self.async_abort(reason="hub_not_found")
 
                 # Update the hub configuration
@@ -104,7 +104,7 @@ class SAJModbusOptionsFlowHandler(config_entries.OptionsFlow):
 
                 return self.async_create_entry(title="", data=user_input)
             except Exception as e:
-                _LOGGER.error(f"Error updating SAJ Modbus configuration: {str(e)}")
+                _LOGGER.error("Error updating SAJ Modbus configuration: %s", e)
                 return self.async_abort(reason="update_failed")
 
         # Show the options form
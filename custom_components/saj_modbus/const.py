@@ -1,3 +1,4 @@
+import sys
 from typing import Optional
 from dataclasses import dataclass
 from homeassistant.components.sensor import (
@@ -26,6 +27,45 @@ DEFAULT_PORT = 502
 CONF_SAJ_HUB = "saj_hub"
 ATTR_MANUFACTURER = "SAJ Electric"
 
+# Fast polling: power-flow sensors that are refreshed on a short interval
+# in between the regular coordinator updates.
+# The keys are interned so membership tests on the fast-poll hot path hit
+# the pointer-equality shortcut in set.__contains__; the reader dicts use
+# the same interned literals.
+FAST_POLL_SENSORS = frozenset(sys.intern(key) for key in {
+    "TotalLoadPower",
+    "CT_GridPowerWatt",
+    "CT_GridPowerVA",
+    "CT_PVPowerWatt",
+    "CT_PVPowerVA",
+    "pvPower",
+    "batteryPower",
+    "totalgridPower",
+    "totalgridPowerVA",
+    "inverterPower",
+    "TotalInvPowerVA",
+    "BackupTotalLoadPowerWatt",
+    "BackupTotalLoadPowerVA",
+    "gridPower",
+})
+
+# Adaptive fast-poll timing: start at the base interval, stretch the delay
+# while values are stable and snap back to the base interval on change.
+FAST_POLL_INTERVAL = 10
+FAST_POLL_MAX_INTERVAL = 60
+FAST_POLL_BACKOFF_FACTOR = 1.5
+
+# Writable holding registers of the H2 settings bank.
+REG_CHARGING_STATE = 0x3604
+REG_DISCHARGING_STATE = 0x3605
+REG_CHARGE_START = 0x3606
+REG_CHARGE_END = 0x3607
+REG_CHARGE_DAY_MASK_POWER = 0x3608
+REG_DISCHARGE_START = 0x361B
+REG_DISCHARGE_END = 0x361C
+REG_DISCHARGE_DAY_MASK_POWER = 0x361D
+REG_APP_MODE = 0x3647
+
 
 @dataclass
 class SensorGroup:
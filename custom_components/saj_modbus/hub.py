@@ -1,20 +1,182 @@
 import asyncio
+import functools
+import random
+import socket
 import logging
-import time
+from contextlib import nullcontext
 from datetime import timedelta
-from typing import List, Callable, Any, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import List, Callable, Any, Dict, Mapping, NamedTuple, Optional, Tuple
 import inspect
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from pymodbus.client import AsyncModbusTcpClient
 from pymodbus.constants import Endian
 from pymodbus.payload import BinaryPayloadDecoder
 from pymodbus.exceptions import ConnectionException, ModbusIOException
 
-from .const import DEVICE_STATUSSES, FAULT_MESSAGES
+try:
+    from pymodbus import __version__ as _PYMODBUS_VERSION
+except ImportError:  # pragma: no cover - very old releases
+    _PYMODBUS_VERSION = "0"
+
+
+def _version_tuple(version: str) -> Tuple[int, ...]:
+    parts = []
+    for part in version.split(".")[:2]:
+        digits = "".join(ch for ch in part if ch.isdigit())
+        parts.append(int(digits or 0))
+    return tuple(parts)
+
+
+# pymodbus >= 3.8 serializes requests in its own transaction manager, so the
+# external lock only has to pay its acquire/release cost on older releases.
+_USE_EXTERNAL_LOCK = _version_tuple(_PYMODBUS_VERSION) < (3, 8)
+
+from .charge_control import ChargeSettingHandler, PENDING_FIELDS, PENDING_WRITE_DEBOUNCE
+from .mqtt import MqttPublisher
+from .const import (
+    DOMAIN,
+    DEVICE_STATUSSES,
+    FAULT_MESSAGES,
+    REG_APP_MODE,
+    REG_CHARGING_STATE,
+    FAST_POLL_SENSORS,
+    FAST_POLL_INTERVAL,
+    FAST_POLL_MAX_INTERVAL,
+    FAST_POLL_BACKOFF_FACTOR,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Resolved once at import; the enum member spelling depends on the HA version.
+_CORESTATE_RUNNING = getattr(CoreState, "running", None) or getattr(CoreState, "RUNNING", None)
+
+# Replacing the shared loop's task factory is not an integration's call to
+# make, but tasks created here can opt into eager start where the running
+# core supports it: a coroutine that finishes without suspending then never
+# pays a scheduler round-trip.
+_EAGER_START_KW = (
+    {"eager_start": True}
+    if "eager_start" in inspect.signature(HomeAssistant.async_create_task).parameters
+    else {}
+)
+
+# Extra delay before the first fast poll while HA is still starting up.
+STARTUP_DELAY = 30.0
+
+# All reader methods of one update cycle; resolved to bound methods once
+# per hub instead of rebuilding the list every poll.
+# Shared empty set for the steady state where no post-write lock is active.
+_NO_LOCKED_KEYS: frozenset = frozenset()
+
+# A register block read again within this window is served from memory;
+# bridges the overlap between the fast loop and the main poll without a
+# second wire round-trip for data that cannot meaningfully have changed.
+READ_CACHE_TTL = 0.5
+
+# Modbus allows at most 125 holding registers per read request.
+MAX_REGISTERS_PER_READ = 125
+# Blocks separated by at most this many unused registers are read in one
+# request; the gap registers are fetched and thrown away, which is still
+# cheaper than a second round-trip.
+READ_MERGE_MAX_GAP = 4
+
+
+def _merge_register_ranges(
+    ranges: Tuple[Tuple[int, int], ...],
+    max_gap: int = READ_MERGE_MAX_GAP,
+    max_count: int = MAX_REGISTERS_PER_READ,
+) -> Tuple[Tuple[int, int], ...]:
+    """Greedily merge (address, count) ranges into as few reads as possible."""
+    merged: List[Tuple[int, int]] = []
+    for address, count in sorted(ranges):
+        if merged:
+            start, span = merged[-1]
+            if address - (start + span) <= max_gap and address + count - start <= max_count:
+                merged[-1] = (start, max(span, address + count - start))
+                continue
+        merged.append((address, count))
+    return tuple(merged)
+
+
+# Register blocks consumed by the slow-poll readers. The plan below merges
+# adjacent blocks (data set 2 parts 1 and 2 become one 64-register read) so
+# each poll cycle pays fewer Modbus round-trips.
+_SLOW_POLL_RANGES: Tuple[Tuple[int, int], ...] = (
+    (16388, 19),             # realtime data
+    (16433, 21),             # grid phase data (set 4)
+    (16494, 15),             # additional data 1 part 1
+    (16533, 25),             # additional data 1 part 2
+    (16575, 32),             # additional data 2 part 1
+    (16607, 32),             # additional data 2 part 2
+    (16711, 48),             # additional data 3
+    (REG_CHARGING_STATE, 2),  # charge/discharge state
+    (REG_APP_MODE, 1),       # app mode
+)
+
+_REGISTER_PLAN = _merge_register_ranges(_SLOW_POLL_RANGES)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_decode_plan(
+    instructions: Tuple[tuple, ...],
+    default_decoder: str,
+    default_factor: float,
+) -> Tuple[Tuple[str, int, int, bool, float], ...]:
+    """Compile decode instructions into a flat (key, offset, size, signed,
+    factor) plan.
+
+    pymodbus already hands the payload over as a list of 16-bit ints, so
+    decoding by register index replaces one BinaryPayloadDecoder method
+    dispatch per field with plain indexing math; the plan is compiled once
+    per instruction list and cached for the life of the process.
+    """
+    plan: List[Tuple[str, int, int, bool, float]] = []
+    offset = 0
+    for instruction in instructions:
+        key, method, factor = (instruction + (default_factor,))[:3]
+        method = method or default_decoder
+        if method == "skip_bytes":
+            offset += factor // 2
+            continue
+        if not key:
+            continue
+        if method == "decode_16bit_uint":
+            size, signed = 1, False
+        elif method == "decode_16bit_int":
+            size, signed = 1, True
+        elif method == "decode_32bit_uint":
+            size, signed = 2, False
+        elif method == "decode_32bit_int":
+            size, signed = 2, True
+        else:
+            raise ValueError(f"Unsupported decode method: {method}")
+        plan.append((key, offset, size, signed, factor))
+        offset += size
+    return tuple(plan)
+
+
+class _ReaderOutcome(NamedTuple):
+    """Result of one reader invocation; exactly one of data/error is set."""
+
+    pair: Tuple[Callable, str]
+    data: Optional[Dict[str, Any]]
+    error: Optional[Exception]
+
+_READER_METHOD_NAMES = (
+    "read_modbus_realtime_data",
+    "read_additional_modbus_data_1_part_1",
+    "read_additional_modbus_data_1_part_2",
+    "read_additional_modbus_data_2_part_1",
+    "read_additional_modbus_data_2_part_2",
+    "read_additional_modbus_data_3",
+    "read_additional_modbus_data_4",
+    "read_charge_control_data",
+)
+
+
 class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
     def __init__(self, hass: HomeAssistant, name: str, host: str, port: int, scan_interval: int) -> None:
         super().__init__(
@@ -28,9 +190,20 @@ class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
         self._port = port
         self._client: Optional[AsyncModbusTcpClient] = None
         self._read_lock = asyncio.Lock()
+        # Guard around wire I/O: the real lock on old pymodbus, a no-op
+        # context manager once the library's transaction manager serializes
+        # requests itself (nullcontext works as an async CM on Python 3.10+).
+        self._wire_guard = self._read_lock if _USE_EXTERNAL_LOCK else nullcontext()
         self._connection_lock = asyncio.Lock()
+        self._connecting_future: Optional[asyncio.Future] = None
+        self._reconnect_future: Optional[asyncio.Future] = None
         self.updating_settings = False
         self.inverter_data: Dict[str, Any] = {}
+        self._inverter_static_data: Optional[Mapping[str, Any]] = None
+        self._static_task: Optional[asyncio.Task] = None
+        # Nameplate data persisted across restarts; keyed per device so
+        # several hubs do not share a file.
+        self._static_store: Store = Store(hass, 1, f"{DOMAIN}_static_{host}_{port}")
         
         self._closing = False
         self._reconnecting = False
@@ -38,6 +211,155 @@ class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
         self._retry_delay = 1
         self._operation_timeout = 30
 
+        self._last_full_update: float = 0.0
+        # Keyed by id(callback) so add and remove are both O(1); the value
+        # holds the sensor key the listener cares about (None = all). The
+        # tuple snapshot is rebuilt on mutation so the per-tick fan-out
+        # iterates a stable tuple without any defensive copy.
+        self._fast_listeners: Dict[int, Tuple[Optional[str], Callable[[], None]]] = {}
+        self._fast_listener_snapshot: Tuple[Tuple[Optional[str], Callable[[], None]], ...] = ()
+        self._fast_handle: Optional[asyncio.TimerHandle] = None
+        self._fast_enabled = False
+        self._fast_current_interval: float = FAST_POLL_INTERVAL
+        # Fast-poll keys confirmed present in the reader output; once known,
+        # the per-tick filter iterates this tuple without membership tests.
+        self._fast_keys_present: Optional[Tuple[str, ...]] = None
+        self._fast_read_in_flight = False
+        self._last_fast_data: Optional[Dict[str, Any]] = None
+        # Exponentially weighted round-trip time of successful reads;
+        # surfaces slave latency in the debug cycle log and would justify
+        # inter-request pacing if a gateway ever needed it (none measured
+        # so far, so no pacing delay is inserted).
+        self._ewma_rtt: float = 0.0
+        # Circuit breaker: after consecutive connection failures the hub
+        # stops touching the wire for an exponentially growing window
+        # instead of letting every loop run its full retry ladder.
+        self._consec_failures = 0
+        self._circuit_open_until: float = 0.0
+        # Bumped on reconfiguration; a fast tick that was already awaiting
+        # the wire when the settings changed sees a stale generation and
+        # drops its result instead of publishing against the new config.
+        self._loop_generation = 0
+        # Set whenever no setting-write batch is in flight. An Event wakes
+        # waiters exactly once instead of them polling a bool flag.
+        self._write_idle = asyncio.Event()
+        self._write_idle.set()
+
+        self.mqtt = MqttPublisher(hass, f"{DOMAIN}/{name}")
+        self._setting_handler = ChargeSettingHandler(self)
+        # Bound-method shortcuts for the handler calls on hot paths; the
+        # call sites then skip one attribute resolution and trampoline
+        # frame per invocation.
+        self._set_pending = self._setting_handler.set_pending
+        self._has_pending = self._setting_handler.has_pending
+        # Every data read addresses unit 1; the partial saves passing the
+        # constant at each call site without adding a trampoline frame.
+        self._read_registers = functools.partial(self.try_read_registers, 1)
+        self._pending_debounce_handle: Optional[asyncio.TimerHandle] = None
+        # Dirty-flag pair backing the single-flush-loop guarantee of
+        # process_pending_now.
+        self._pending_dirty = False
+        self._pending_flush_active = False
+        self._init_setters()
+        self._all_readers: Tuple[Tuple[Callable, str], ...] = tuple(
+            (getattr(self, name), name) for name in _READER_METHOD_NAMES
+        )
+        # Per-cycle register views sliced out of the coalesced prefetch
+        # reads; empty outside a slow-poll cycle so other callers (fast
+        # poll, retries) fall through to direct reads.
+        self._cycle_registers: Dict[Tuple[int, int], List[int]] = {}
+        # Short-TTL raw register cache keyed by (address, count); absorbs
+        # back-to-back reads of the same block from the fast and slow
+        # loops. Cleared whenever a register is written.
+        self._read_cache: Dict[Tuple[int, int], Tuple[float, List[int]]] = {}
+
+    @callback
+    def set_pending_value(self, field: str, value: Any) -> None:
+        """Queue a pending write; synchronous, does no I/O itself."""
+        self._set_pending(field, value)
+        self._schedule_pending_write()
+
+    async def _generic_setter(self, field: str, value: Any) -> None:
+        """Queue a value and flush it directly.
+
+        Async callers are already on the loop, so awaiting the flush skips
+        the debounce timer and its task allocation; concurrent setters
+        still coalesce through the single flush loop's dirty flag. The
+        synchronous set_pending_value path keeps the timer for UI bursts.
+        """
+        self._set_pending(field, value)
+        if self._pending_debounce_handle:
+            self._pending_debounce_handle.cancel()
+            self._pending_debounce_handle = None
+        await self.process_pending_now()
+
+    # Guards the one-time class-level setter binding below.
+    _setters_bound = False
+
+    def _init_setters(self) -> None:
+        """Bind one set_<field> method per writable field on the class.
+
+        functools.partialmethod descriptors are created once for the first
+        hub and shared by every instance afterwards; per-hub there is no
+        allocation at all, and dispatch stays one C-level partial call.
+        """
+        cls = type(self)
+        if cls._setters_bound:
+            return
+        for field in PENDING_FIELDS:
+            setattr(cls, f"set_{field}", functools.partialmethod(cls._generic_setter, field))
+        cls._setters_bound = True
+
+    def _schedule_pending_write(self) -> None:
+        """Debounce pending writes: (re)start a short timer on every setter
+        call so a burst of UI toggles collapses into one write batch."""
+        if self._pending_debounce_handle:
+            self._pending_debounce_handle.cancel()
+        self._pending_debounce_handle = self.hass.loop.call_later(
+            PENDING_WRITE_DEBOUNCE,
+            lambda: self.hass.async_create_task(self.process_pending_now(), **_EAGER_START_KW),
+        )
+
+    async def process_pending_now(self) -> None:
+        """Flush all queued setting writes to the inverter.
+
+        Only one flush loop runs at a time: a call arriving while a flush
+        is in progress just marks it dirty, and the running loop picks the
+        newly queued values up in its next pass instead of a second task
+        racing it onto the wire with possibly superseded values.
+        """
+        self._pending_debounce_handle = None
+        self._pending_dirty = True
+        if self._pending_flush_active:
+            return
+        self._pending_flush_active = True
+        # Give the write batch the wire without fast reads queueing up in
+        # between; the event wakes any deferred tick exactly once.
+        self._write_idle.clear()
+        try:
+            while self._pending_dirty:
+                self._pending_dirty = False
+                if not self._has_pending():
+                    continue
+                try:
+                    await self.ensure_connection()
+                    await self._setting_handler.process_pending()
+                except Exception as e:
+                    _LOGGER.error("Failed to process pending settings: %s", e)
+                else:
+                    self.async_update_listeners()
+        finally:
+            self._pending_flush_active = False
+            self._write_idle.set()
+
+    def _now(self) -> float:
+        """Monotonic timestamp from the event loop.
+
+        The loop caches its clock per iteration, so this is cheaper than
+        calling time.monotonic() and just as monotonic.
+        """
+        return self.hass.loop.time()
+
     def _create_client(self) -> AsyncModbusTcpClient:
         """Creates a new optimized instance of the AsyncModbusTcpClient."""
         client = AsyncModbusTcpClient(
@@ -46,7 +368,7 @@ class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
             timeout=10,
             
         )
-        _LOGGER.debug(f"Created new Modbus client: AsyncModbusTcpClient {self._host}:{self._port}")
+        _LOGGER.debug("Created new Modbus client: AsyncModbusTcpClient %s:%s", self._host, self._port)
         return client
 
     async def update_connection_settings(self, host: str, port: int, scan_interval: int) -> None:
@@ -57,12 +379,15 @@ class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
                 connection_changed = (host != self._host) or (port != self._port)
                 self._host = host
                 self._port = port
+                self._loop_generation += 1
                 self.update_interval = timedelta(seconds=scan_interval)
 
                 if connection_changed:
                     await self._safe_close()
                     self._client = self._create_client()
                     await self.ensure_connection()
+
+                self.mqtt.set_base_topic(f"{DOMAIN}/{self.name}")
             finally:
                 self.updating_settings = False
 
@@ -83,7 +408,7 @@ class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
                         return not self._client.connected
                 return True
         except Exception as e:
-                _LOGGER.warning(f"Error during safe close: {e}", exc_info=True)
+                _LOGGER.warning("Error during safe close: %s", e, exc_info=True)
                 return False
         finally:
                 self._client = None
@@ -100,24 +425,95 @@ class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
                         async with self._connection_lock:
                                 await self._safe_close()
         except (asyncio.TimeoutError, Exception) as e:
-                _LOGGER.warning(f"Error during close: {e}", exc_info=True)
+                _LOGGER.warning("Error during close: %s", e, exc_info=True)
         finally:
                 self._closing = False
 
 
     async def ensure_connection(self) -> None:
-            """Ensure the Modbus connection is established and stable."""
-            if self._client and self._client.connected:
+            """Ensure the Modbus connection is established and stable.
+
+            Single-flight: when a connect is already in progress, later
+            callers await the same future instead of queueing up on a lock
+            for an operation that only needs to run once.
+            """
+            # Lock-free fast path: in steady state the socket is up, so the
+            # call returns after one attribute load and one property check.
+            # A True-to-False transition right after the check only matters
+            # for the next caller, who re-enters and connects.
+            client = self._client
+            if client is not None and client.connected:
                 return
 
-            self._client = self._client or self._create_client()
+            if self._connecting_future is not None:
+                await self._connecting_future
+                return
+
+            future: asyncio.Future = self.hass.loop.create_future()
+            self._connecting_future = future
             try:
+                self._client = self._client or self._create_client()
                 await asyncio.wait_for(self._client.connect(), timeout=10)
-                _LOGGER.info("Successfully connected to Modbus server.")
+                self._tune_socket()
+                _LOGGER.debug("Successfully connected to Modbus server.")
+                future.set_result(True)
             except Exception as e:
-                _LOGGER.warning(f"Error during connection attempt: {e}", exc_info=True)
-                raise ConnectionException("Failed to connect to Modbus server.") from e
+                _LOGGER.warning("Error during connection attempt: %s", e, exc_info=True)
+                exc = ConnectionException("Failed to connect to Modbus server.")
+                exc.__cause__ = e
+                future.set_exception(exc)
+                future.exception()  # mark retrieved for the no-waiter case
+                raise exc
+            finally:
+                self._connecting_future = None
+
+
+    def _tune_socket(self) -> None:
+        """Disable Nagle batching on the freshly connected socket.
+
+        Modbus PDUs are a dozen bytes; on a persistent connection Nagle
+        can hold each of them back for up to ~40 ms waiting for an ACK.
+        Keepalive additionally surfaces a silently dead inverter link
+        instead of the first read timing out. Best effort - the transport
+        layout differs between pymodbus versions.
+        """
+        transport = getattr(self._client, "transport", None)
+        if transport is None:
+            return
+        try:
+            sock = transport.get_extra_info("socket")
+            if sock is not None:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except (OSError, AttributeError) as e:
+            _LOGGER.debug("Could not tune Modbus socket: %s", e)
+
+    async def _ensure_reconnected(self) -> None:
+        """Single-flight close-and-reconnect for the retry paths.
 
+        Several operations failing in the same window would otherwise each
+        close the shared client, tearing down the connection a sibling just
+        reestablished; the first caller does the work, the rest await the
+        same future.
+        """
+        if self._reconnect_future is not None:
+            await self._reconnect_future
+            return
+
+        future: asyncio.Future = self.hass.loop.create_future()
+        self._reconnect_future = future
+        try:
+            if not await self._safe_close():
+                _LOGGER.warning("Failed to safely close the Modbus client.")
+            await self.ensure_connection()
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved for the no-waiter case
+            raise
+        else:
+            future.set_result(True)
+        finally:
+            self._reconnect_future = None
 
     async def try_read_registers(
             self,
@@ -128,52 +524,530 @@ class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
             base_delay: float = 2.0
         ) -> List[int]:
             """Reads Modbus registers with optimized error handling."""
+            cache_key = (address, count)
+            cached = self._read_cache.get(cache_key)
+            if cached is not None and self._now() - cached[0] < READ_CACHE_TTL:
+                return cached[1]
             for attempt in range(max_retries):
                 try:
-                    async with self._read_lock:
-                        response = await self._client.read_holding_registers(address, count, slave=unit)
+                    # Bind per attempt: reconnects may swap self._client.
+                    client = self._client
+                    request_start = self._now()
+                    async with self._wire_guard:
+                        response = await client.read_holding_registers(address, count, slave=unit)
                     if (not response) or response.isError() or len(response.registers) != count:
                         raise ModbusIOException(f"Invalid response from address {address}")
-                        
+
+                    # EWMA with alpha 0.2: smooth enough to ignore single
+                    # outliers, fresh enough to track gateway slowdowns.
+                    rtt = self._now() - request_start
+                    self._ewma_rtt += 0.2 * (rtt - self._ewma_rtt) if self._ewma_rtt else rtt
+
+                    self._read_cache[cache_key] = (self._now(), response.registers)
                     return response.registers
                     
                 except (ModbusIOException, ConnectionException) as e:
-                    _LOGGER.error(f"Read attempt {attempt + 1} failed at address {address}: {e}")
+                    _LOGGER.error("Read attempt %d failed at address %s: %s", attempt + 1, address, e)
                     if attempt < max_retries - 1:
+                        # +/-25% jitter desynchronizes concurrent retriers so they
+                        # do not hammer the inverter in lockstep.
                         delay = min(base_delay * (2 ** attempt), 10.0)
-                        await asyncio.sleep(delay)
-                        if not await self._safe_close():
-                            _LOGGER.warning("Failed to safely close the Modbus client.")
+                        await asyncio.sleep(delay * (0.75 + random.random() * 0.5))
                         try:
-                            await self.ensure_connection()
+                            await self._ensure_reconnected()
                         except ConnectionException:
                             _LOGGER.error("Failed to reconnect Modbus client.")
                             continue
                         else:
-                            _LOGGER.info("Reconnected Modbus client successfully.")
-            _LOGGER.error(f"Failed to read registers from unit {unit}, address {address} after {max_retries} attempts")
+                            _LOGGER.debug("Reconnected Modbus client successfully.")
+            _LOGGER.error("Failed to read registers from unit %s, address %s after %d attempts", unit, address, max_retries)
             raise ConnectionException(f"Read operation failed for address {address} after {max_retries} attempts")
 
 
+    async def _write_register(
+            self,
+            address: int,
+            value: int,
+            max_retries: int = 3,
+            base_delay: float = 2.0
+        ) -> bool:
+            """Writes a single Modbus register with the same retry handling as reads."""
+            for attempt in range(max_retries):
+                try:
+                    client = self._client
+                    async with self._wire_guard:
+                        response = await client.write_register(address, value, slave=1)
+                    if (not response) or response.isError():
+                        raise ModbusIOException(f"Invalid response writing address {address}")
+
+                    # Cached blocks may now be stale; writes are rare, so a
+                    # full clear beats tracking overlaps per address.
+                    self._read_cache.clear()
+                    return True
+
+                except (ModbusIOException, ConnectionException) as e:
+                    _LOGGER.error("Write attempt %d failed at address %s: %s", attempt + 1, address, e)
+                    if attempt < max_retries - 1:
+                        # +/-25% jitter desynchronizes concurrent retriers so they
+                        # do not hammer the inverter in lockstep.
+                        delay = min(base_delay * (2 ** attempt), 10.0)
+                        await asyncio.sleep(delay * (0.75 + random.random() * 0.5))
+                        try:
+                            await self._ensure_reconnected()
+                        except ConnectionException:
+                            _LOGGER.error("Failed to reconnect Modbus client.")
+                            continue
+            raise ConnectionException(f"Write operation failed for address {address} after {max_retries} attempts")
+
+
+    async def _write_registers(
+            self,
+            address: int,
+            values: List[int],
+            max_retries: int = 3,
+            base_delay: float = 2.0
+        ) -> bool:
+            """Writes a contiguous register block with the same retry handling
+            as single writes.
+
+            Uses function 0x17 (read/write multiple) where the client offers
+            it: the write and its read-back share one transaction, giving a
+            free verification pass without a second round-trip. Registers
+            the inverter applies asynchronously may legitimately read back
+            differently, so a mismatch is only logged at debug level.
+            """
+            for attempt in range(max_retries):
+                try:
+                    client = self._client
+                    readwrite = getattr(client, "readwrite_registers", None)
+                    async with self._wire_guard:
+                        if readwrite is not None:
+                            response = await readwrite(
+                                read_address=address,
+                                read_count=len(values),
+                                write_address=address,
+                                values=values,
+                                slave=1,
+                            )
+                        else:
+                            response = await client.write_registers(address, values, slave=1)
+                    if (not response) or response.isError():
+                        raise ModbusIOException(f"Invalid response writing address {address}")
+                    if readwrite is not None and getattr(response, "registers", None) != values:
+                        _LOGGER.debug(
+                            "Write to %s read back as %s (wrote %s)",
+                            address, getattr(response, "registers", None), values,
+                        )
+
+                    # Cached blocks may now be stale; writes are rare, so a
+                    # full clear beats tracking overlaps per address.
+                    self._read_cache.clear()
+                    return True
+
+                except (ModbusIOException, ConnectionException) as e:
+                    _LOGGER.error("Block write attempt %d failed at address %s: %s", attempt + 1, address, e)
+                    if attempt < max_retries - 1:
+                        # +/-25% jitter desynchronizes concurrent retriers so they
+                        # do not hammer the inverter in lockstep.
+                        delay = min(base_delay * (2 ** attempt), 10.0)
+                        await asyncio.sleep(delay * (0.75 + random.random() * 0.5))
+                        try:
+                            await self._ensure_reconnected()
+                        except ConnectionException:
+                            _LOGGER.error("Failed to reconnect Modbus client.")
+                            continue
+            raise ConnectionException(f"Block write failed for address {address} after {max_retries} attempts")
+
+    def get_charging_state(self) -> Optional[bool]:
+        """Return whether battery charging is currently enabled."""
+        return self._get_power_state("charging_enabled")
+
+    def get_discharging_state(self) -> Optional[bool]:
+        """Return whether battery discharging is currently enabled."""
+        return self._get_power_state("discharging_enabled")
+
+    def _get_power_state(self, state_key: str) -> Optional[bool]:
+        """Derive an enabled flag from the cached state and AppMode values.
+
+        Plain dict lookups on cached ints cannot raise, so this is a
+        synchronous function without defensive exception handling; callers
+        pay no coroutine frame per query.
+        """
+        data = self.inverter_data
+        value = data.get(state_key)
+        app_mode = data.get("AppMode")
+        if value is None or app_mode is None:
+            return None
+        return value > 0 and app_mode == 1
+
+
     async def _async_update_data(self) -> Dict[str, Any]:
-            await self.ensure_connection()
-            if not self.inverter_data:
-                self.inverter_data.update(await self.read_modbus_inverter_data())
-            combined_data = {**self.inverter_data}
-            for method in [
-                self.read_modbus_realtime_data,
-                self.read_additional_modbus_data_1_part_1,
-                self.read_additional_modbus_data_1_part_2,
-                self.read_additional_modbus_data_2_part_1,
-                self.read_additional_modbus_data_2_part_2,
-                self.read_additional_modbus_data_3,
-                self.read_additional_modbus_data_4
-            ]:
-                combined_data.update(await method())
-                await asyncio.sleep(0.2)
-            await self.close()
-            return combined_data
+            # Manual refresh bursts (entity update service calls and the
+            # like) within most of a scan interval re-serve the cache: the
+            # registers cannot have drifted meaningfully and no write is
+            # waiting for a read-back.
+            if (
+                self._last_full_update
+                and not self._has_pending()
+                and self._now() - self._last_full_update
+                < self.update_interval.total_seconds() * 0.8
+            ):
+                return self.inverter_data
+            # While the circuit is open the inverter is known unreachable;
+            # serve stale data instead of burning a full retry ladder.
+            if self._now() < self._circuit_open_until:
+                return self.inverter_data
+            # Cycle timing is only collected when it can actually be seen;
+            # with debug logging off the cost is one isEnabledFor check.
+            timing = _LOGGER.isEnabledFor(logging.DEBUG)
+            cycle_start = self._now() if timing else 0.0
+            try:
+                await self.ensure_connection()
+            except ConnectionException:
+                self._trip_circuit()
+                raise
+            self._consec_failures = 0
+            self._kick_static_data_load()
+            await self._prefetch_register_blocks()
+            new_data = await self._run_reader_methods()
+            self._cycle_registers = {}
+            # Merge in place: inverter_data keeps its identity across
+            # cycles, the previous values of failed readers stay available
+            # (stale-while-revalidate) and no full-size dict is reallocated
+            # every poll.
+            self.inverter_data.update(new_data)
+            # The publisher diffs against its last-published values, so the
+            # steady state sends only the handful of keys that actually
+            # changed, not the full ~200-key cache.
+            self.mqtt.publish_data(self.inverter_data)
+            # The connection stays up between cycles: the fast loop reuses
+            # it within seconds anyway, and keeping it open avoids a TCP
+            # teardown/handshake per poll. It is closed on unload and
+            # around host/port changes only.
+            self._last_full_update = self._now()
+            if timing:
+                _LOGGER.debug(
+                    "Update cycle finished in %.3f s (EWMA read RTT %.1f ms)",
+                    self._last_full_update - cycle_start,
+                    self._ewma_rtt * 1000.0,
+                )
+            return self.inverter_data
+
+    def _trip_circuit(self) -> None:
+        """Open the circuit after a connection failure.
+
+        The quiet window doubles per consecutive failure and is capped at
+        one minute, so a rebooting inverter is retried quickly while a
+        dead one is not hammered by every loop.
+        """
+        self._consec_failures += 1
+        window = min(60.0, 2.0 ** self._consec_failures)
+        self._circuit_open_until = self._now() + window
+        _LOGGER.debug(
+            "Circuit open for %.0f s after %d consecutive failures",
+            window, self._consec_failures,
+        )
+
+    def _kick_static_data_load(self) -> None:
+        """Load the immutable inverter data without blocking the dynamic poll.
+
+        The nameplate data (serial number, device type, versions) never
+        changes, so it is fetched once in a background task that runs
+        concurrently with the first dynamic poll and is merged into the
+        cache as soon as it is available.
+        """
+        if self._inverter_static_data is not None:
+            return
+        if self._static_task is None:
+            self._static_task = asyncio.create_task(self._load_static_data())
+        elif self._static_task.done():
+            static_data = self._static_task.result()
+            if static_data:
+                # Frozen after the one merge below: the nameplate snapshot
+                # is never copied again per poll, and the proxy guarantees
+                # no later caller mutates it behind the cache's back.
+                self._inverter_static_data = MappingProxyType(static_data)
+                self.inverter_data.update(static_data)
+            else:
+                # Read failed; retry on the next cycle.
+                self._static_task = None
+
+    async def _load_static_data(self) -> Dict[str, Any]:
+        """Restore the nameplate data from disk, or read and persist it.
+
+        The serial number and hardware versions never change, so after the
+        first boot the block is served from storage; a one-register check
+        of the communication version guards against restoring data from a
+        replaced or re-flashed inverter.
+        """
+        stored = await self._static_store.async_load()
+        if stored:
+            try:
+                regs = await self._read_registers(0x8F02, 1)
+            except Exception as e:
+                # Wire unavailable; stale nameplate data beats none at all.
+                _LOGGER.debug("Could not verify stored inverter data: %s", e)
+                return stored
+            if round(regs[0] * 0.001, 3) == stored.get("commver"):
+                return stored
+            _LOGGER.debug("Stored inverter data outdated, re-reading")
+        data = await self.read_modbus_inverter_data()
+        if data:
+            await self._static_store.async_save(data)
+        return data
+
+    async def _run_reader_methods(self) -> Dict[str, Any]:
+        """Run all reader methods concurrently and merge their results.
+
+        The shared read lock already serializes access to the wire, so the
+        readers can be scheduled in one batch instead of awaiting each one
+        in turn; the gather only overlaps the scheduling overhead.
+        """
+        readers = self._all_readers
+
+        async def _tagged(pair: Tuple[Callable, str]) -> _ReaderOutcome:
+            try:
+                return _ReaderOutcome(pair, await pair[0](), None)
+            except Exception as e:
+                return _ReaderOutcome(pair, None, e)
+
+        new_data: Dict[str, Any] = {}
+        current_time = self._now()
+        # Freshly written state registers that the inverter has not
+        # confirmed yet are scrubbed from reader results so the switches do
+        # not flap back. In the common steady state no lock window is
+        # active, so a single cheap gate skips the scrub bookkeeping
+        # entirely; the per result check is then just a falsy test.
+        handler = self._setting_handler
+        locked_keys: frozenset = _NO_LOCKED_KEYS
+        if handler.any_lock_active(current_time):
+            locked_keys = frozenset(
+                key
+                for key, locked in (
+                    ("charging_enabled", handler.is_charging_locked(current_time)),
+                    ("discharging_enabled", handler.is_discharging_locked(current_time)),
+                )
+                if locked
+            )
+        # TaskGroup runs the batch with structured cancellation and without
+        # the wrapper futures as_completed would allocate; _tagged never
+        # raises, so one reader failing cannot cancel its siblings.
+        async def _run_batch(pairs) -> List[_ReaderOutcome]:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(_tagged(pair)) for pair in pairs]
+            return [task.result() for task in tasks]
+
+        successes: List[Dict[str, Any]] = []
+
+        def _collect(batch: List[_ReaderOutcome]) -> List[_ReaderOutcome]:
+            failures = []
+            for outcome in batch:
+                # Success first: the overwhelmingly common outcome takes
+                # the branch without touching the error path at all.
+                if outcome.error is None:
+                    result = outcome.data
+                    if locked_keys and not locked_keys.isdisjoint(result):
+                        for key in locked_keys & result.keys():
+                            del result[key]
+                    successes.append(result)
+                else:
+                    failures.append(outcome)
+            return failures
+
+        failures = _collect(await _run_batch(readers))
+        if failures:
+            # A dead connection typically fails several readers in the same
+            # cycle; one shared connection check followed by a single
+            # parallel retry pass replaces a reconnect per failed reader.
+            try:
+                await self.ensure_connection()
+                failures = _collect(await _run_batch([f.pair for f in failures]))
+            except Exception as e:
+                _LOGGER.debug("Reconnect before reader retry failed: %s", e)
+            for outcome in failures:
+                _LOGGER.error("Reader %s failed: %s", outcome.pair[1], outcome.error)
+        # Bulk-merge once after the loop: the reader keys are disjoint, so
+        # the order does not matter, and a single merge pass amortizes the
+        # hash-table growth over all results instead of resizing per reader.
+        for result in successes:
+            new_data |= result
+        return new_data
+
+
+    def async_add_fast_listener(
+        self, update_callback: Callable[[], None], key: Optional[str] = None
+    ) -> Callable[[], None]:
+        """Register a callback fired when fast-polled values change.
+
+        When a sensor key is given, the callback only fires for ticks in
+        which that key's value actually changed.
+        """
+        self._fast_listeners[id(update_callback)] = (key, update_callback)
+        self._fast_listener_snapshot = tuple(self._fast_listeners.values())
 
+        def remove_listener() -> None:
+            if self._fast_listeners.pop(id(update_callback), None) is not None:
+                self._fast_listener_snapshot = tuple(self._fast_listeners.values())
+
+        return remove_listener
+
+    def start_fast_updates(self) -> None:
+        """Start the adaptive fast-poll loop for the power-flow sensors."""
+        if self._fast_enabled:
+            return
+        self._fast_enabled = True
+        self._fast_current_interval = FAST_POLL_INTERVAL
+        self._schedule_fast_update(self._get_startup_delay())
+
+    def _get_startup_delay(self) -> float:
+        """Delay for the first fast tick.
+
+        While HA is still starting, entity setup and the first coordinator
+        refresh should not compete with fast polls, so the first tick is
+        pushed out; once running, the normal interval applies.
+        """
+        # Identity compare: CoreState is an enum, so `is` skips __eq__
+        # dispatch; the None guard covers exotic HA builds where the
+        # member could not be resolved at import.
+        if _CORESTATE_RUNNING is not None and self.hass.state is _CORESTATE_RUNNING:
+            return self._fast_current_interval
+        return STARTUP_DELAY
+
+    def stop_fast_updates(self) -> None:
+        """Stop the fast-poll loop."""
+        self._fast_enabled = False
+        if self._fast_handle:
+            self._fast_handle.cancel()
+            self._fast_handle = None
+
+    def _schedule_fast_update(self, delay: float) -> None:
+        if self._fast_handle:
+            self._fast_handle.cancel()
+        self._fast_handle = self.hass.loop.call_later(delay, self._fast_tick)
+
+    def _fast_tick(self) -> None:
+        """Timer callback: kick off one fast update task."""
+        self.hass.async_create_task(self._async_update_fast(), **_EAGER_START_KW)
+
+    async def _async_update_fast(self) -> None:
+        """Poll the fast-changing power sensors and adapt the poll interval.
+
+        While values keep changing the loop runs at FAST_POLL_INTERVAL; when
+        they are stable (e.g. at night with zero PV) the delay is stretched by
+        FAST_POLL_BACKOFF_FACTOR up to FAST_POLL_MAX_INTERVAL, and snaps back
+        to the base interval as soon as a value changes again.
+        """
+        self._fast_handle = None
+        if not self._fast_enabled or self._closing:
+            return
+        try:
+            # The main cycle has just refreshed the same registers; re-reading
+            # them now would only contend for the read lock at the boundary.
+            if self._now() - self._last_full_update < FAST_POLL_INTERVAL * 0.5:
+                return
+            # Only one fast read in flight; a tick arriving while the
+            # previous read still runs is simply dropped. This keeps the
+            # serialization bool-cheap - the wire itself is still protected
+            # by the read lock shared with the main poll.
+            if self._fast_read_in_flight:
+                return
+            # A pending-write batch owns the wire right now; skip this tick
+            # instead of queueing a read between its registers.
+            if not self._write_idle.is_set():
+                return
+            # Known-dead inverter: let the tick lapse until the circuit
+            # closes again rather than stacking connect timeouts.
+            if self._now() < self._circuit_open_until:
+                return
+            self._fast_read_in_flight = True
+            generation = self._loop_generation
+            # Happy path: the socket is usually still up, so avoid awaiting
+            # ensure_connection (and its re-checks) on every tick.
+            client = self._client
+            if client is None or not client.connected:
+                await self.ensure_connection()
+            result = await self.read_fast_poll_block()
+            # Settings changed while the read was on the wire; the data
+            # belongs to the old connection, drop it.
+            if generation != self._loop_generation:
+                return
+            if not result:
+                return
+            keys = self._fast_keys_present
+            if keys is None:
+                fast_data = {k: result[k] for k in FAST_POLL_SENSORS if k in result}
+                self._fast_keys_present = tuple(fast_data)
+            else:
+                fast_data = {k: result[k] for k in keys}
+            if fast_data:
+                # Whole-batch equality first: dict comparison runs at C
+                # level and catches the idle steady state in one shot.
+                if fast_data == self._last_fast_data:
+                    self._fast_current_interval = min(
+                        self._fast_current_interval * FAST_POLL_BACKOFF_FACTOR,
+                        FAST_POLL_MAX_INTERVAL,
+                    )
+                    return
+                self._last_fast_data = fast_data
+                prev = self.inverter_data
+                changed_keys = {k for k in fast_data if fast_data[k] != prev.get(k)}
+                if changed_keys:
+                    self._fast_current_interval = FAST_POLL_INTERVAL
+                    # self.data aliases inverter_data (already bound as
+                    # prev), so one merge updates both the cache and the
+                    # coordinator data.
+                    prev.update(fast_data)
+                    # Only wake the listeners whose key actually changed.
+                    for key, listener in self._fast_listener_snapshot:
+                        if key is None or key in changed_keys:
+                            listener()
+                    self.mqtt.publish_data(fast_data)
+                else:
+                    # Nothing visible would change; skip the merge and the
+                    # listener fan-out entirely.
+                    self._fast_current_interval = min(
+                        self._fast_current_interval * FAST_POLL_BACKOFF_FACTOR,
+                        FAST_POLL_MAX_INTERVAL,
+                    )
+        except Exception as e:
+            _LOGGER.debug("Fast update failed: %s", e)
+        finally:
+            self._fast_read_in_flight = False
+            if self._fast_enabled and not self._closing:
+                self._schedule_fast_update(self._fast_current_interval)
+
+
+    async def _prefetch_register_blocks(self) -> None:
+        """Read all merged slow-poll ranges and slice them into block views.
+
+        Coalescing adjacent blocks into one request (bounded by the Modbus
+        125-register window) cuts the round-trips per poll cycle; the
+        reader methods then decode their slice of the prefetched registers
+        instead of each issuing its own wire read.
+        """
+        cycle: Dict[Tuple[int, int], List[int]] = {}
+        for start, span in _REGISTER_PLAN:
+            try:
+                regs = await self._read_registers(start, span)
+            except Exception as e:
+                _LOGGER.debug(
+                    "Prefetch of %s/%s failed, readers fall back to direct reads: %s",
+                    start, span, e,
+                )
+                continue
+            for address, count in _SLOW_POLL_RANGES:
+                offset = address - start
+                if 0 <= offset and offset + count <= span:
+                    cycle[(address, count)] = regs[offset:offset + count]
+        self._cycle_registers = cycle
+
+    async def _read_block_registers(self, address: int, count: int) -> List[int]:
+        """Return a register block, served from the per-cycle prefetch when
+        available; other callers fall through to a direct read."""
+        cached = self._cycle_registers.get((address, count))
+        if cached is not None:
+            return cached
+        return await self._read_registers(address, count)
 
     async def _read_modbus_data(
             self,
@@ -185,33 +1059,24 @@ class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
             default_factor: float = 0.01
         ) -> Dict[str, Any]:
             try:
-                regs = await self.try_read_registers(1, start_address, count)
-                decoder = BinaryPayloadDecoder.fromRegisters(regs, byteorder=Endian.BIG)
+                regs = await self._read_block_registers(start_address, count)
+                plan = _compile_decode_plan(
+                    tuple(decode_instructions), default_decoder, default_factor
+                )
                 new_data = {}
-
-                for instruction in decode_instructions:
-                    key, method, factor = (instruction + (default_factor,))[:3]
-                    method = method or default_decoder
-
-                    if method == "skip_bytes":
-                        decoder.skip_bytes(factor)
-                        continue
-
-                    if not key:
-                        continue
-
-                    try:
-                        value = getattr(decoder, method)()
-                        if isinstance(value, bytes):
-                            value = value.decode("ascii", errors="replace").strip()
-                        new_data[key] = round(value * factor, 2) if factor != 1 else value
-                    except Exception as e:
-                        _LOGGER.error(f"Error decoding {key}: {e}")
-                        return {}
-
+                for key, offset, size, signed, factor in plan:
+                    if size == 1:
+                        value = regs[offset]
+                        if signed and value >= 0x8000:
+                            value -= 0x10000
+                    else:
+                        value = (regs[offset] << 16) | regs[offset + 1]
+                        if signed and value >= 0x8000_0000:
+                            value -= 0x1_0000_0000
+                    new_data[key] = round(value * factor, 2) if factor != 1 else value
                 return new_data
             except Exception as e:
-                _LOGGER.error(f"Error reading modbus data: {e}")
+                _LOGGER.error("Error reading modbus data: %s", e)
                 return {}
 
 
@@ -219,7 +1084,7 @@ class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
     async def read_modbus_inverter_data(self) -> Dict[str, Any]:
         """Reads basic inverter data."""
         try:
-            regs = await self.try_read_registers(1, 0x8F00, 29)
+            regs = await self._read_registers(0x8F00, 29)
             decoder = BinaryPayloadDecoder.fromRegisters(regs, byteorder=Endian.BIG)
             data = {}
 
@@ -242,7 +1107,7 @@ class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
             return data
 
         except Exception as e:
-            _LOGGER.error(f"Error reading inverter data: {e}")
+            _LOGGER.error("Error reading inverter data: %s", e)
             return {}
 
     async def read_modbus_realtime_data(self) -> Dict[str, Any]:
@@ -285,7 +1150,7 @@ class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
         data["faultmsg"] = ", ".join(fault_messages).strip()[:254]
         
         if fault_messages:
-            _LOGGER.error(f"Fault detected: {data['faultmsg']}")
+            _LOGGER.error("Fault detected: %s", data['faultmsg'])
             
         return data
 
@@ -352,6 +1217,35 @@ class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
 
 
 
+    async def read_fast_poll_block(self) -> Dict[str, Any]:
+            """
+            Reads only the contiguous power-readings window that backs
+            FAST_POLL_SENSORS, so the fast loop does not pay for the full
+            additional_data_1_part_2 block every tick.
+            """
+            decode_instructions_fast = [
+                ("TotalLoadPower", "decode_16bit_int"),
+                ("CT_GridPowerWatt", "decode_16bit_int"),
+                ("CT_GridPowerVA", "decode_16bit_int"),
+                ("CT_PVPowerWatt", "decode_16bit_int"),
+                ("CT_PVPowerVA", "decode_16bit_int"),
+                ("pvPower", "decode_16bit_int"),
+                ("batteryPower", "decode_16bit_int"),
+                ("totalgridPower", "decode_16bit_int"),
+                ("totalgridPowerVA", "decode_16bit_int"),
+                ("inverterPower", "decode_16bit_int"),
+                ("TotalInvPowerVA", "decode_16bit_int"),
+                ("BackupTotalLoadPowerWatt", "decode_16bit_uint"),
+                ("BackupTotalLoadPowerVA", "decode_16bit_uint"),
+                ("gridPower", "decode_16bit_int"),
+            ]
+
+            return await self._read_modbus_data(
+                16544, 14, decode_instructions_fast, 'fast_poll_block',
+                default_decoder="decode_16bit_uint", default_factor=1
+            )
+
+
     async def read_additional_modbus_data_2_part_1(self) -> Dict[str, Any]:
         """Reads the first part of additional operating data (Set 2)."""
 
@@ -395,6 +1289,20 @@ class SAJModbusHub(DataUpdateCoordinator[Dict[str, Any]]):
         
         
         
+    async def read_charge_control_data(self) -> Dict[str, Any]:
+        """Reads the charge/discharge state registers and the app mode."""
+        try:
+            state_regs = await self._read_block_registers(REG_CHARGING_STATE, 2)
+            app_mode = await self._read_block_registers(REG_APP_MODE, 1)
+            return {
+                "charging_enabled": state_regs[0],
+                "discharging_enabled": state_regs[1],
+                "AppMode": app_mode[0],
+            }
+        except Exception as e:
+            _LOGGER.error("Error reading charge control data: %s", e)
+            return {}
+
     async def read_additional_modbus_data_4(self) -> Dict[str, Any]:
             """
             Reads data for grid parameters (R, S, and T phase).
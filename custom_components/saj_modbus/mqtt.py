@@ -0,0 +1,146 @@
+"""Optional MQTT publishing of fast-poll sensor values."""
+import asyncio
+import logging
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant
+
+from .const import FAST_POLL_SENSORS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Re-check whether the MQTT integration is loaded at most this often.
+_MQTT_CHECK_INTERVAL_NS = 30_000_000_000
+
+
+@lru_cache(maxsize=256)
+def normalize_sensor_key(key: str) -> str:
+    """Normalize a sensor key for use as an MQTT topic segment.
+
+    The key universe is small and fixed, so after warm-up every call is a
+    single cache probe.
+    """
+    return key.strip("/").lower()
+
+
+def _format_value(value: Any) -> str:
+    """Format a payload, taking the fast path for the numeric sensor types."""
+    if type(value) is int:
+        return "%d" % value
+    if type(value) is float:
+        return repr(value)
+    return str(value)
+
+
+def _build_messages(
+    data: Dict[str, Any],
+    topics: Dict[str, str],
+    last: Dict[str, Any],
+    topic_fallback,
+) -> List[Tuple[str, str]]:
+    """Build the (topic, payload) list for the changed values.
+
+    Kept as a module-level function working purely on locals so the hot
+    loop runs without self lookups; topic_fallback handles (rare) keys
+    missing from the topic cache.
+    """
+    last_get = last.get
+    topics_get = topics.get
+    messages = []
+    append = messages.append
+    for k, v in data.items():
+        if last_get(k) == v:
+            continue
+        last[k] = v
+        append((topics_get(k) or topic_fallback(k), _format_value(v)))
+    return messages
+
+
+class MqttPublisher:
+    """Publishes sensor values through Home Assistant's MQTT integration.
+
+    Values are published fire-and-forget; when the MQTT integration is not
+    loaded, publish_data is a cheap no-op.
+    """
+
+    def __init__(self, hass: HomeAssistant, base_topic: str) -> None:
+        self._hass = hass
+        self._base_topic = base_topic.rstrip("/")
+        # Sensor key -> full topic, precomputed for the static fast-poll
+        # keys so the hot path is a dict lookup instead of normalizing and
+        # formatting per value; unknown keys are added on first use.
+        self._topic_cache: Dict[str, str] = {
+            k: f"{self._base_topic}/{normalize_sensor_key(k)}" for k in FAST_POLL_SENSORS
+        }
+        # Last value published per key; unchanged values are not re-sent.
+        self._last_published: Dict[str, Any] = {}
+        self._mqtt_available: Optional[bool] = None
+        self._mqtt_last_check_ns = 0
+
+    def set_base_topic(self, base_topic: str) -> None:
+        """Re-point the publisher at a new base topic.
+
+        No-op when the topic is unchanged, so callers can invoke this on
+        every config update; the per-key topic cache is only rebuilt on an
+        actual change.
+        """
+        base_topic = base_topic.rstrip("/")
+        if base_topic == self._base_topic:
+            return
+        self._base_topic = base_topic
+        self._topic_cache = {
+            k: f"{base_topic}/{normalize_sensor_key(k)}" for k in FAST_POLL_SENSORS
+        }
+        self._last_published.clear()
+
+    def _is_ha_mqtt_available(self) -> bool:
+        """Memoized component check; integer ns compare keeps the hot path
+        free of float allocation."""
+        now = time.monotonic_ns()
+        if (
+            self._mqtt_available is not None
+            and now - self._mqtt_last_check_ns < _MQTT_CHECK_INTERVAL_NS
+        ):
+            return self._mqtt_available
+        self._mqtt_available = "mqtt" in self._hass.config.components
+        self._mqtt_last_check_ns = now
+        return self._mqtt_available
+
+    def publish_data(self, data: Dict[str, Any]) -> None:
+        """Publish all given values in a single scheduled task.
+
+        One task awaiting a gather of publishes replaces one task per
+        sensor, which at fast-poll rates saves a Task allocation and
+        scheduler wakeup per topic.
+        """
+        if not data or not self._is_ha_mqtt_available():
+            return
+        messages = _build_messages(
+            data, self._topic_cache, self._last_published, self._topic
+        )
+        if messages:
+            self._hass.async_create_task(self._publish_all(messages))
+
+    def _topic(self, key: str) -> str:
+        """Slow path: compute and cache the topic for a new sensor key."""
+        topic = f"{self._base_topic}/{normalize_sensor_key(key)}"
+        self._topic_cache[key] = topic
+        return topic
+
+    async def _publish_all(self, messages: List[Tuple[str, str]]) -> None:
+        from homeassistant.components import mqtt
+
+        try:
+            # QoS 0, no retain: fire-and-forget into HA's persistent MQTT
+            # client; the broker connection is shared and never torn down
+            # between publishes.
+            await asyncio.gather(
+                *(
+                    mqtt.async_publish(self._hass, topic, payload, 0, False)
+                    for topic, payload in messages
+                )
+            )
+        except Exception as e:
+            _LOGGER.debug("MQTT publish failed: %s", e)
@@ -6,7 +6,7 @@ from homeassistant.components.sensor import SensorEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 import logging
 
-from .const import DOMAIN, SENSOR_TYPES, SajModbusSensorEntityDescription
+from .const import DOMAIN, FAST_POLL_SENSORS, SENSOR_TYPES, SajModbusSensorEntityDescription
 from .hub import SAJModbusHub
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,7 +22,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         entities.append(entity)
 
     async_add_entities(entities)
-    _LOGGER.info(f"Added {len(entities)} SAJ sensors")
+    _LOGGER.debug("Added %d SAJ sensors", len(entities))
 
 class SajSensor(CoordinatorEntity, SensorEntity):
     """Representation of an SAJ Modbus sensor."""
@@ -44,7 +44,7 @@ class SajSensor(CoordinatorEntity, SensorEntity):
         """Return the state of the sensor."""
         value = self.coordinator.data.get(self.entity_description.key)
         if value is None:
-            _LOGGER.debug(f"No data for sensor {self._attr_name}")
+            _LOGGER.debug("No data for sensor %s", self._attr_name)
         return value
 
     @property
@@ -63,7 +63,13 @@ class SajSensor(CoordinatorEntity, SensorEntity):
         self.async_on_remove(
             self.coordinator.async_add_listener(self._handle_coordinator_update)
         )
-        _LOGGER.debug(f"Sensor {self._attr_name} added to Home Assistant")
+        if self.entity_description.key in FAST_POLL_SENSORS:
+            self.async_on_remove(
+                self.coordinator.async_add_fast_listener(
+                    self._handle_coordinator_update, self.entity_description.key
+                )
+            )
+        _LOGGER.debug("Sensor %s added to Home Assistant", self._attr_name)
 
     async def async_update(self) -> None:
         """Update the entity."""
@@ -0,0 +1,52 @@
+"""SAJ Modbus switches for battery charge/discharge control."""
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+import logging
+
+from .const import DOMAIN
+from .hub import SAJModbusHub
+
+_LOGGER = logging.getLogger(__name__)
+
+SWITCH_TYPES = (
+    ("charging_enabled", "Charging"),
+    ("discharging_enabled", "Discharging"),
+)
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
+    """Set up SAJ charge control switches from a config entry."""
+    hub: SAJModbusHub = hass.data[DOMAIN][entry.entry_id]["hub"]
+    device_info = hass.data[DOMAIN][entry.entry_id]["device_info"]
+
+    async_add_entities(
+        SajChargeControlSwitch(hub, device_info, key, name)
+        for key, name in SWITCH_TYPES
+    )
+
+class SajChargeControlSwitch(CoordinatorEntity, SwitchEntity):
+    """Switch toggling a charge/discharge state register on the inverter."""
+
+    def __init__(self, hub: SAJModbusHub, device_info: dict, key: str, name: str):
+        """Initialize the switch."""
+        super().__init__(coordinator=hub)
+        self._key = key
+        self._attr_device_info = device_info
+        self._attr_unique_id = f"{hub.name}_{key}"
+        self._attr_name = f"{hub.name} {name}"
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if the state register reports enabled."""
+        data = self.coordinator.data or {}
+        return bool(data.get(self._key))
+
+    async def async_turn_on(self, **kwargs) -> None:
+        """Queue enabling the state register."""
+        self.coordinator.set_pending_value(self._key, 1)
+
+    async def async_turn_off(self, **kwargs) -> None:
+        """Queue disabling the state register."""
+        self.coordinator.set_pending_value(self._key, 0)